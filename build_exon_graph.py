@@ -0,0 +1,93 @@
+#!python3
+
+import pprint
+from bisect import bisect_left, bisect_right
+
+
+def is_junction(pair):
+    """Given a pair of consecutive (start,end) segments, return
+    True if there is an intron between them, and False if they
+    are contiguous pieces of the same exon"""
+    return pair[0][1] + 1 < pair[1][0]
+
+
+def build_exon_graph(transcripts):
+    """Given a dictionary where the keys are transcript IDs
+    and values are lists of (start,end) exon offsets, build the
+    'sequence graph' expected by draw_exon_sequence_graph.
+    Overlapping exons (e.g. alternative 5' or 3' splice sites) are
+    split into disjoint segments using a sweep over the sorted
+    exon boundaries, so the returned dictionary has these keys -
+     - 'exons' an ordered list of disjoint (start,end) segments
+     - 'sequences' a list of unique segment sequences
+     - 'junctions' a dictionary mapping pairs of consecutive
+       segments separated by an intron to the number of
+       transcripts using that pair"""
+
+    # 1. Collect the boundaries of every exon as sweep events.
+    #    Offsets are inclusive, so an exon (start,end) covers
+    #    [start, end + 1) on the sweep line.
+    events = []
+    for transcript_id in transcripts:
+        for start, end in transcripts[transcript_id]["exons"]:
+            events.append((start, 1))
+            events.append((end + 1, -1))
+    events.sort()
+
+    # 2. Sweep from left to right, emitting a segment between every
+    #    pair of consecutive boundaries which is covered by some exon
+    segments = []
+    coverage = 0
+    previous = None
+    for position, delta in events:
+        if previous is not None and position > previous and coverage > 0:
+            segments.append((previous, position - 1))
+        coverage += delta
+        previous = position
+
+    segment_starts = [segment[0] for segment in segments]
+    segment_ends = [segment[1] for segment in segments]
+
+    # 3. Map every transcript onto the segments its exons cover,
+    #    and count how many transcripts use each pair of segments
+    sequence_graph = {"exons": segments, "sequences": [], "junctions": {}}
+    seen_sequences = set()
+    for transcript_id in transcripts:
+        sequence = []
+        for start, end in sorted(transcripts[transcript_id]["exons"]):
+            first = bisect_left(segment_starts, start)
+            last = bisect_right(segment_ends, end)
+            sequence.extend(segments[first:last])
+
+        # Consecutive segments which touch are pieces of one exon,
+        # only pairs separated by an intron are splice junctions
+        for pair in set(zip(sequence, sequence[1:])):
+            if not is_junction(pair):
+                continue
+            sequence_graph["junctions"][pair] = (
+                sequence_graph["junctions"].get(pair, 0) + 1
+            )
+
+        key = tuple(sequence)
+        if key not in seen_sequences:
+            seen_sequences.add(key)
+            sequence_graph["sequences"].append(sequence)
+
+    return sequence_graph
+
+
+if __name__ == "__main__":
+    transcripts = {
+        "t1": {
+            "exons": [(20, 25), (30, 35), (50, 55), (70, 75)],
+        },
+        "t2": {
+            "exons": [(20, 25), (32, 35), (50, 58), (70, 75)],
+        },
+        "t3": {
+            "exons": [(20, 25), (30, 35), (50, 55), (70, 75)],
+        },
+    }
+    sequence_graph = build_exon_graph(transcripts)
+    pp = pprint.PrettyPrinter()
+    pp.pprint(sequence_graph)
@@ -29,7 +29,9 @@ def draw_exon_sequence_graph(
 
     exons = sequence_graph["exons"]
     if not to_scale:
-        unscaled_mapping, unscaled_exons = make_exons_unscaled(exons)
+        unscaled_mapping, unscaled_exons = make_exons_unscaled(
+            exons, merge_contiguous=True
+        )
         exons = unscaled_exons
 
     patches = make_exon_shapes(exons, y_exons)
@@ -39,11 +41,14 @@ def draw_exon_sequence_graph(
     sequence_index = 0
     draw_position = ["mid", "top", "bottom"]
     for sequence in sequence_graph["sequences"]:
+        # Pieces of one exon which touch each other are not joined
+        # by a line, only pairs separated by an intron are
+        exon_pairs = [p for p in zip(sequence, sequence[1:]) if p[0][1] + 1 < p[1][0]]
         if not to_scale:
-            unscaled_sequence = [unscaled_mapping[x] for x in sequence]
-            sequence = unscaled_sequence
+            exon_pairs = [
+                (unscaled_mapping[p[0]], unscaled_mapping[p[1]]) for p in exon_pairs
+            ]
 
-        exon_pairs = zip(sequence, sequence[1:])
         make_exon_exon_lines(
             exon_pairs,
             ax,
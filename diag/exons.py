@@ -65,14 +65,23 @@ def make_exon_exon_lines(
         ax.add_line(line)
 
 
-def make_exons_unscaled(exons):
+def make_exons_unscaled(exons, merge_contiguous=False):
+    """Lays out exons with equal widths and gaps. If merge_contiguous
+    is set, exons which touch each other are drawn without a gap,
+    so that the pieces of one exon look like a single exon"""
     unscaled_mapping = {}
     cur_x = configuration["unscaled_exon_start"]
+    previous = None
     for exon in exons:
+        if previous is not None:
+            if merge_contiguous and previous[1] + 1 >= exon[0]:
+                cur_x += configuration["unscaled_exon_width"]
+            else:
+                cur_x += configuration["unscaled_exon_width"] * 2
         unscaled_mapping[exon] = (
             cur_x,
             cur_x + configuration["unscaled_exon_width"],
         )
-        cur_x += configuration["unscaled_exon_width"] * 2
+        previous = exon
     unscaled_exons = [unscaled_mapping[x] for x in exons]
     return unscaled_mapping, unscaled_exons
@@ -5,7 +5,9 @@ import sys
 from read_gtf import read_gtf
 from diag.draw_transcripts import draw_transcripts
 from diag.draw_exon_sequence_forest import draw_exon_sequence_forest
+from diag.draw_exon_sequence_graph import draw_exon_sequence_graph
 from analyze_sequences import analyze_sequences
+from build_exon_graph import build_exon_graph
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
@@ -16,3 +18,5 @@ if __name__ == "__main__":
     draw_transcripts(transcripts)
     forest = analyze_sequences(transcripts)
     draw_exon_sequence_forest(forest, add_exon_labels=True, merge_common_sequences=True)
+    sequence_graph = build_exon_graph(transcripts)
+    draw_exon_sequence_graph(sequence_graph, title=sys.argv[2], to_scale=False)